@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import sys
 
 from typing import (
     Any,
@@ -8,10 +9,11 @@ from typing import (
     Callable,
     Collection,
     Dict,
-    Generator,
+    Iterator,
     List,
     Optional,
     overload,
+    Tuple,
     Type,
     TYPE_CHECKING,
     TypeVar,
@@ -42,29 +44,103 @@ __all__ = (
 )
 
 
+_fold = str.casefold
+_intern = sys.intern
+
+
+class _CIKey(str):
+    """A string that hashes and compares by its casefolded form.
+
+    The folded form and its hash are computed once at construction,
+    so dict probes against these keys reuse the precomputed hash
+    instead of building a fresh folded string per lookup.
+    """
+
+    __slots__ = ('_folded', '_hash')
+
+    def __new__(cls, key: str, /) -> _CIKey:
+        self = str.__new__(cls, key)
+        # ASCII-only keys (the overwhelmingly common case for command names)
+        # can take str.lower, which is considerably cheaper than a full
+        # Unicode casefold.
+        folded = key.lower() if key.isascii() else _fold(key)
+        # Short keys (command names) are interned so equality checks hit
+        # the pointer-comparison fast path.
+        if len(folded) <= 32:
+            folded = _intern(folded)
+
+        self._folded = folded
+        self._hash = hash(folded)
+        return self
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _CIKey):
+            return self._folded == other._folded
+
+        if isinstance(other, str):
+            return self._folded == (other.lower() if other.isascii() else _fold(other))
+
+        return NotImplemented
+
+    def __ne__(self, other: Any) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+
 class CaseInsensitiveDict(Dict[str, V]):
-    """Represents a case-insensitive dictionary."""
+    """Represents a case-insensitive dictionary.
+
+    Keys are wrapped exactly once, at insertion, and retain their
+    original casing - lookups only pay for folding the probe key.
+    """
+
+    @staticmethod
+    def _norm(key: str, /) -> str:
+        if type(key) is _CIKey:
+            return key
+
+        return _CIKey(key)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self.update(*args, **kwargs)
 
     def __getitem__(self, key: str) -> V:
-        return super().__getitem__(key.casefold())
+        return super().__getitem__(self._norm(key))
 
     def __setitem__(self, key: str, value: V) -> None:
-        super().__setitem__(key.casefold(), value)
+        super().__setitem__(self._norm(key), value)
 
     def __delitem__(self, key: str) -> None:
-        return super().__delitem__(key.casefold())
+        return super().__delitem__(self._norm(key))
 
     def __contains__(self, key: str) -> bool:
-        return super().__contains__(key.casefold())
+        return super().__contains__(self._norm(key))
 
     def get(self, key: str, default: DefaultT = None) -> Union[V, DefaultT]:
-        return super().get(key.casefold(), default)
+        return super().get(self._norm(key), default)
 
     def pop(self, key: str, default: DefaultT = None) -> Union[V, DefaultT]:
-        return super().pop(key.casefold(), default)
+        return super().pop(self._norm(key), default)
+
+    def setdefault(self, key: str, default: DefaultT = None) -> Union[V, DefaultT]:
+        return super().setdefault(self._norm(key), default)
+
+    def update(self, *args, **kwargs) -> None:
+        norm = self._norm
+        for key, value in dict(*args, **kwargs).items():
+            super().__setitem__(norm(key), value)
 
     get.__doc__ = dict.get.__doc__
     pop.__doc__ = dict.pop.__doc__
+    setdefault.__doc__ = dict.setdefault.__doc__
+    update.__doc__ = dict.update.__doc__
 
 
 class CommandSink:
@@ -83,21 +159,37 @@ class CommandSink:
     def __init__(self, *, case_insensitive: bool = False) -> None:
         mapping_factory = CaseInsensitiveDict if case_insensitive else dict
         self.command_mapping = mapping_factory()
+        self._unique: Dict[int, Command] = {}
+        self._commands_cache: Optional[List[Command]] = None
 
-    def walk_commands(self) -> Generator[Command, None, None]:
-        """Returns a generator that walks through all of the commands
+    def walk_commands(self) -> Iterator[Command]:
+        """Returns an iterator that walks through all of the commands
         this sink holds.
 
         Returns
         -------
-        Generator[:class:`.Command`, None, None]
+        Iterator[:class:`.Command`]
         """
-        seen = set()
+        return iter(self._unique.values())
 
-        for command in self.command_mapping.values():
-            if command not in seen:
-                seen.add(command)
-                yield command
+    def add_command(self, command: Command, /) -> None:
+        """Registers a command to this sink.
+
+        The command's name and each of its aliases are inserted into
+        :attr:`~.CommandSink.command_mapping`, so alias lookups resolve
+        in a single dict probe.
+
+        Parameters
+        ----------
+        command: :class:`~.Command`
+            The command to register.
+        """
+        self._unique[id(command)] = command
+        self._commands_cache = None
+
+        self.command_mapping[command.name] = command
+        for alias in command.aliases:
+            self.command_mapping[alias] = command
 
     def get_command(self, name: str, /, default: DefaultT = None) -> Union[Command, DefaultT]:
         """Tries to get a command by it's name.
@@ -179,18 +271,21 @@ class CommandSink:
                 **kwargs
             )
 
-            self.command_mapping[name] = command
-            for alias in aliases:
-                self.command_mapping[alias] = command
-
+            self.add_command(command)
             return command
 
         return decorator
 
     @property
     def commands(self) -> List[Command]:
-        """List[:class:`.Command`]: A list of the commands this sink holds."""
-        return list(self.walk_commands())
+        """List[:class:`.Command`]: A list of the commands this sink holds.
+
+        This list is cached and only rebuilt when a command is registered.
+        """
+        if self._commands_cache is None:
+            self._commands_cache = list(self._unique.values())
+
+        return self._commands_cache
 
 
 class Bot(_TemporaryClient, CommandSink):
@@ -213,12 +308,16 @@ class Bot(_TemporaryClient, CommandSink):
         strip_after_prefix: bool = False,
         **kwargs
     ) -> None:
-        super().__init__(**kwargs)
-        CommandSink.__init__(self, case_insensitive=case_insensitive)
+        super().__init__(case_insensitive=case_insensitive, **kwargs)
 
         self.prefix: PrefixT = self._sanitize_prefix(prefix, case_insensitive=prefix_case_insensitive)
         self.strip_after_prefix: bool = bool(strip_after_prefix)
 
+        # 0 = str, 1 = callable, 2 = tuple of strings; computed once here
+        # so per-message prefix resolution is an integer compare rather
+        # than isinstance/callable checks.
+        self._prefix_kind: int = 0 if isinstance(self.prefix, str) else 2 if isinstance(self.prefix, tuple) else 1
+
         self._prefix_case_insensitive: bool = bool(prefix_case_insensitive)
         self._default_case_insensitive: bool = bool(case_insensitive)
 
@@ -242,7 +341,7 @@ class Bot(_TemporaryClient, CommandSink):
                 raise TypeError(f'Prefix collection must only consist of strings, not {type(invalid)!r}.')
 
             res = list(map(str.casefold, prefix)) if case_insensitive else list(prefix)
-            return sorted(res, key=len, reverse=True)
+            return tuple(sorted(res, key=len, reverse=True))
 
         if callable(prefix) and allow_callable:
             return _ensure_casefold(ensure_async(prefix), case_insensitive=case_insensitive)
@@ -252,6 +351,20 @@ class Bot(_TemporaryClient, CommandSink):
             f'or functions that return them are allowed.'
         )
 
+    @staticmethod
+    def _match_prefix(content: str, prefixes: Tuple[str, ...], /) -> Optional[str]:
+        # str.startswith accepts a tuple and checks every candidate in a
+        # single C call, so the common no-match case never enters a
+        # Python-level loop.
+        if not content.startswith(prefixes):
+            return None
+
+        # Prefixes are sorted longest-first, so the first hit is the
+        # most specific match.
+        for prefix in prefixes:
+            if content.startswith(prefix):
+                return prefix
+
     async def get_prefix(self, message: Message, *, prefix: BasePrefixT = None) -> Optional[BasePrefixT]:
         """Gets the prefix, or list of prefixes from the given message.
         If the message does not start with a prefix, ``None`` is returned.
@@ -265,29 +378,30 @@ class Bot(_TemporaryClient, CommandSink):
         -------
         Union[str, List[str]]
         """
-        prefix = self.prefix if prefix is None else prefix
+        if prefix is None:
+            prefix = self.prefix
+            kind = self._prefix_kind
+        else:
+            # Recursive calls pass an already-sanitized prefix,
+            # which is never a callable.
+            kind = 0 if isinstance(prefix, str) else 2
+
         content = message.content
 
         if self._prefix_case_insensitive:
             content = content.casefold()
 
-        if isinstance(prefix, str):
+        if kind == 0:
             if content.startswith(prefix):
                 return prefix
             else:
                 return None
 
-        if isinstance(prefix, list):
-            try:
-                return next(filter(lambda pf: content.startswith(pf), prefix))
-            except StopIteration:
-                return None
-
-        if isinstance(prefix, callable):
-            prefix = await prefix(self, message)
-            return self.get_prefix(message, prefix=prefix)
+        if kind == 2:
+            return self._match_prefix(content, prefix)
 
-        return None
+        prefix = await prefix(self, message)
+        return await self.get_prefix(message, prefix=prefix)
 
     async def get_context(self, message: Message, *, cls: Type[Context] = Context) -> Context:
         """Parses a :class:`~.Context` out of a message.
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import inspect
+import sys
 
 from typing import (
     Any,
@@ -9,7 +9,6 @@ from typing import (
     Collection,
     Dict,
     Generic,
-    List,
     Optional,
     Tuple,
     TYPE_CHECKING,
@@ -39,15 +38,28 @@ __all__ = (
 )
 
 
-class Command(Parser, Generic[P, R]):
+if TYPE_CHECKING:
+    class _CommandBase(Parser, Generic[P, R]):
+        ...
+else:
+    # Only inherit the Generic machinery when type-checking; at runtime
+    # it would add subclass/instantiation overhead for no benefit.
+    class _CommandBase(Parser):
+        __slots__ = ()
+
+        def __class_getitem__(cls, item):
+            return cls
+
+
+class Command(_CommandBase):
     """Represents a command.
 
     Attributes
     ----------
     name: str
         The name of this command.
-    aliases: List[str]
-        A list of aliases for this command.
+    aliases: Tuple[str, ...]
+        A tuple of aliases for this command.
     usage: str
         The custom usage string for this command, or ``None``.
         See :attr:`~.Command.signature` for an auto-generated version.
@@ -56,6 +68,16 @@ class Command(Parser, Generic[P, R]):
         This could be ``None``.
     """
 
+    __slots__ = (
+        'error_callback',
+        'name',
+        'aliases',
+        'usage',
+        '_brief',
+        '_description',
+        '_metadata',
+    )
+
     def __init__(
         self,
         callback: CommandCallback,
@@ -69,8 +91,10 @@ class Command(Parser, Generic[P, R]):
     ) -> None:
         self.error_callback: Optional[ErrorCallback] = None
 
-        self.name: str = name
-        self.aliases: List[str] = list(aliases)
+        # Interned names guarantee the identity fast-path in dict lookups
+        # when the same name string resolves a command repeatedly.
+        self.name: str = sys.intern(name)
+        self.aliases: Tuple[str, ...] = tuple(map(sys.intern, aliases))
         self.usage: Optional[str] = usage
 
         self._brief: Optional[str] = brief
@@ -119,7 +143,10 @@ class Command(Parser, Generic[P, R]):
         if not doc:
             return ''
 
-        return inspect.cleandoc(doc)
+        # Deferred; this property is only read by cold paths such as
+        # help rendering.
+        from inspect import cleandoc
+        return cleandoc(doc)
 
     @property
     def qualified_name(self) -> str:
@@ -144,7 +171,7 @@ class Command(Parser, Generic[P, R]):
         """
         self.error_callback = func
 
-    # Replace `_temporary_dispatch` with an event dispatcher of your choice.
+    # Rebind `commands.temporary.dispatch` to an event dispatcher of your choice.
 
     async def execute(self, ctx: Context, content: str) -> None:
         """|coro|
@@ -190,8 +217,9 @@ class Command(Parser, Generic[P, R]):
         **kwargs
             The keyword arguments to pass into the callback.
         """
+        _temporary_dispatch('command', ctx)
+
         try:
-            _temporary_dispatch('command', ctx)
             await ctx.callback(ctx, *args, **kwargs)
         except Exception as exc:
             if self.error_callback:
@@ -200,13 +228,15 @@ class Command(Parser, Generic[P, R]):
                 except Exception as new_exc:
                     exc = new_exc
                 else:
+                    _temporary_dispatch('command_complete', ctx)
                     return
 
             _temporary_dispatch('command_error', ctx, exc)
-        else:
-            _temporary_dispatch('command_success', ctx)
-        finally:
             _temporary_dispatch('command_complete', ctx)
+            return
+
+        _temporary_dispatch('command_success', ctx)
+        _temporary_dispatch('command_complete', ctx)
 
 
 class Context:
@@ -237,6 +267,18 @@ class Context:
         The string-reader that was used to parse this command. Could be ``None``.
     """
 
+    __slots__ = (
+        'bot',
+        'message',
+        'prefix',
+        'invoked_with',
+        'command',
+        'callback',
+        'args',
+        'kwargs',
+        'reader',
+    )
+
     def __init__(self, bot: Bot, message: Message) -> None:
         self.bot: Bot = bot
         self.message: Message = message
@@ -282,4 +324,7 @@ class Context:
 
         .. note:: No checks will be called here.
         """
-        await self.invoke(self.command, *self.args, **self.kwargs)
+        # The command and arguments are already stored on this context,
+        # so go straight to Command.invoke rather than repacking them
+        # through Context.invoke again.
+        await self.command.invoke(self, *self.args, **self.kwargs)
@@ -701,21 +701,20 @@ class StringReader:
         -------
         str
         """
-        char = ...
-        buffer = ''
-
         if skip_first:
             self.skip_to_word()
 
-        while not self._is_whitespace(char):
-            char = self.next_character()
-            if self.eof:
-                return buffer
+        # Scan with index arithmetic and slice the word out in one go
+        # rather than building it up one character at a time.
+        buffer = self.buffer
+        start = index = self.index + 1
+        length = len(buffer)
 
-            buffer += char
+        while index < length and not buffer[index].isspace():
+            index += 1
 
-        buffer = buffer[:-1]
-        return buffer
+        self.index = index
+        return buffer[start:index]
 
     def next_quoted_word(self, *, skip_first: bool = True) -> str:
         """Returns the next quoted word in the string.
@@ -741,19 +740,25 @@ class StringReader:
 
         end_quote = self.quotes[first_char]
 
-        char = ...
-        buffer = ''
+        # Let str.find scan for the closing quote at C speed, retrying
+        # past any quote that is escaped with a backslash.
+        buffer = self.buffer
+        start = search = self.index + 1
 
-        while char != end_quote or self.buffer[self.index - 1] == '\\':
-            char = self.next_character()
-            if self.eof:
-                return buffer
+        while True:
+            index = buffer.find(end_quote, search)
+            if index == -1:
+                # No closing quote; consume the rest of the string.
+                self.index = len(buffer)
+                return buffer[start:]
+
+            if buffer[index - 1] != '\\':
+                break
 
-            buffer += char
+            search = index + 1
 
-        self.next_character()
-        buffer = buffer[:-1]
-        return buffer
+        self.index = index + 1
+        return buffer[start:index]
 
 
 class _Subparser:
@@ -868,6 +873,8 @@ class _Subparser:
 class Parser:
     """The main class that parses arguments."""
 
+    __slots__ = ('_overloads',)
+
     def __init__(self, *, overloads: List[_Subparser] = None) -> None:
         self._overloads: List[_Subparser] = overloads or []
 
@@ -12,10 +12,30 @@ class _TemporaryMessage:
         self.content = content
 
 
-def _temporary_dispatch(event: str, *args, **kwargs) -> None:
-    """Replace this with the event dispatcher callback of your library."""
+# Flip this on to print every dispatched event for debugging.
+_DISPATCH_ENABLED = False
+
+
+def _default_dispatch(event: str, *args, **kwargs) -> None:
+    if not _DISPATCH_ENABLED:
+        return
+
     print(f'[DISPATCH {event}] args: {args} kwargs: {kwargs}')
 
 
+# Rebind this to the event dispatcher callback of your library,
+# e.g. ``commands.temporary.dispatch = my_client.dispatch``.
+dispatch = _default_dispatch
+
+
+def _temporary_dispatch(event: str, *args, **kwargs) -> None:
+    """The stable entry point the rest of the package dispatches through.
+
+    Call sites bind this name at import time, so rebind :data:`dispatch`
+    (not this function) to swap out the dispatcher.
+    """
+    dispatch(event, *args, **kwargs)
+
+
 # For type-hinting
 Message = _TemporaryMessage
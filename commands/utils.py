@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-import inspect
-import functools
-
 from typing import Awaitable, Callable, TYPE_CHECKING, TypeVar, Union, overload
 
 if TYPE_CHECKING:
@@ -32,18 +29,31 @@ def ensure_async(func: Callable[P, R], /) -> Callable[P, Awaitable[R]]:
 def ensure_async(func: Union[Callable[P, Awaitable[R]], Callable[P, R]], /) -> Callable[P, Awaitable[R]]:
     """Ensures that the given function is asynchronous.
 
-    In other terms, if the function is already async, it will stay the same.
+    In other terms, if the function is already async, it is returned unchanged.
     Else, it will be converted into an async function. (Note that it will still be ran synchronously.)
     """
-    @functools.wraps(func)
+    # Deferred so merely importing this module doesn't pull in inspect
+    # (and everything it drags along) at startup.
+    from inspect import isawaitable, iscoroutinefunction
+
+    if iscoroutinefunction(func):
+        return func
+
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
         maybe_coro = func(*args, **kwargs)
 
-        if inspect.isawaitable(maybe_coro):
+        if isawaitable(maybe_coro):
             return await maybe_coro
 
         return maybe_coro
 
+    # Copy just the metadata we care about; functools.wraps does a fair
+    # bit more work per decoration than these four assignments.
+    wrapper.__wrapped__ = func
+    wrapper.__name__ = getattr(func, '__name__', 'wrapper')
+    wrapper.__qualname__ = getattr(func, '__qualname__', wrapper.__name__)
+    wrapper.__doc__ = getattr(func, '__doc__', None)
+
     return wrapper
 
 
@@ -54,7 +64,13 @@ def to_error_string(exc: Exception, /) -> str:
     If no error text exists, only the error name will be returned,
     e.g. just ``ValueError``.
     """
-    if str(exc).strip():
-        return '{0.__class__.__name__}: {0}'.format(exc)
-    else:
-        return exc.__class__.__name__
+    text = str(exc)
+    name = type(exc).__name__
+
+    # Scan for a non-whitespace character rather than allocating
+    # a stripped copy of the message just to test emptiness.
+    for char in text:
+        if not char.isspace():
+            return f'{name}: {text}'
+
+    return name